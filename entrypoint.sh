@@ -10,6 +10,17 @@ if [[ "$INPUT_SHARE" == "true" ]]; then
   SHARE_FLAG="--share"
 fi
 
+if [[ -n "$INPUT_CACHE_FILE" ]]; then
+  if [[ -f "$INPUT_CACHE_FILE" ]]; then
+    pr-pulse cache import "$INPUT_CACHE_FILE" --verbose ||
+      echo "warning: could not import $INPUT_CACHE_FILE, starting without cache"
+  fi
+  # export even when the analysis fails, so PRs fetched so far are kept; a
+  # failed export must not change the exit status of the analysis
+  trap 'pr-pulse cache export "$INPUT_CACHE_FILE" --verbose ||
+    echo "warning: could not export $INPUT_CACHE_FILE"' EXIT
+fi
+
 pr-pulse analyze summary "$INPUT_REPOSITORY" \
   --days "$INPUT_DAYS" \
   --verbose \
@@ -1,6 +1,6 @@
 import typer
 
-from .commands import analyze, get
+from .commands import analyze, cache, get, mcp
 
 app = typer.Typer(
     help="PR Pulse: A command-line tool for analyzing GitHub pull requests",
@@ -10,6 +10,10 @@ app.add_typer(get.app, name="get", help="Fetch and view PR data from GitHub")
 app.add_typer(
     analyze.app, name="analyze", help="Analyze PR data and generate Pulse insights"
 )
+app.add_typer(
+    cache.app, name="cache", help="Export and import cached PR data snapshots"
+)
+app.add_typer(mcp.app, name="mcp", help="Serve PR data to agents over MCP")
 
 
 @app.callback(invoke_without_command=True)
@@ -1,9 +1,18 @@
 import typer
 from rich.console import Console
 
+from pr_pulse.constants import (
+    CLUSTER_SIMILARITY_THRESHOLD,
+    LLM_HEDGE_AFTER,
+    LLM_REQUEST_TIMEOUT,
+)
 from pr_pulse.core import clients
 from pr_pulse.core.chains import generate_pr_summary_from_data
+from pr_pulse.core.checkpoint import RunCheckpoint, setup_run_checkpoint
+from pr_pulse.core.clusters import cluster_pr_data
+from pr_pulse.core.fio import write_text_to_file
 from pr_pulse.core.github import get_prs_details_data
+from pr_pulse.core.planner import display_plan_table, plan_run
 from pr_pulse.core.slack import create_report_text
 
 app = typer.Typer(
@@ -33,20 +42,96 @@ def summary(
     share: bool = typer.Option(
         False, "--share", help="Share the generated report to Slack"
     ),
+    collapse_noise: bool = typer.Option(
+        True,
+        "--collapse-noise/--keep-noise",
+        help="Collapse bot/noise PRs (dependency bumps, releases) into one summary record",
+    ),
+    cluster: bool = typer.Option(
+        True,
+        "--cluster/--no-cluster",
+        help="Group related PRs into a single prompt entry",
+    ),
+    similarity_threshold: float = typer.Option(
+        CLUSTER_SIMILARITY_THRESHOLD,
+        "--similarity-threshold",
+        help="Minimum title/description similarity (0-1) for PRs to be grouped",
+    ),
+    timeout: float = typer.Option(
+        LLM_REQUEST_TIMEOUT, "--timeout", help="Per-request LLM timeout in seconds"
+    ),
+    hedge_after: float = typer.Option(
+        LLM_HEDGE_AFTER,
+        "--hedge-after",
+        help="Start a backup LLM request if no token arrives within this many seconds (0 to disable)",
+    ),
+    resume: bool = typer.Option(
+        False, "--resume", help="Resume the last failed run, skipping completed work"
+    ),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Refetch PRs instead of reusing stored records (picks up new comments and edits)",
+    ),
+    plan: bool = typer.Option(
+        False,
+        "--plan",
+        help="Only estimate API calls, wall time, prompt tokens and check they fit the budget",
+    ),
 ):
-    """Generates a Pulse insights summary using Gemini AI"""
+    """Generates a Pulse insights summary using an LLM"""
     try:
-        repository, g = clients.setup_github_client(repo, verbose)
-        pr_data = get_prs_details_data(repository, g, repo, days, verbose)
+        if plan:
+            pool = clients.setup_github_pool(repo, verbose)
+            run_plan = plan_run(
+                pool,
+                repo,
+                days,
+                collapse_noise,
+                RunCheckpoint(repo, days),
+                verbose,
+            )
+            display_plan_table(run_plan)
+            if not (run_plan["fits_rate_limit"] and run_plan["fits_token_budget"]):
+                raise typer.Exit(1)
+            return
+
+        checkpoint = setup_run_checkpoint(repo, days, resume, refresh, verbose)
+
+        if checkpoint.is_stage_done("summary"):
+            if verbose:
+                console.print("[bold blue]skipping[/] summary (loaded from checkpoint)")
+            report = checkpoint.load_stage("summary")
+            console.print(report)
+            if write:
+                write_text_to_file(report, "pr-pulse-report", verbose)
+        else:
+            pool = clients.setup_github_pool(repo, verbose)
+            pr_data = get_prs_details_data(
+                pool,
+                repo,
+                days,
+                verbose,
+                collapse_noise,
+                checkpoint,
+            )
+            if cluster:
+                pr_data = cluster_pr_data(pr_data, similarity_threshold, verbose)
 
-        gemini_client = clients.setup_gemini_client(verbose)
-        report = generate_pr_summary_from_data(
-            pr_data=pr_data,
-            llm=gemini_client,
-            stream=stream,
-            verbose=verbose,
-            write=write,
-        )
+            providers = clients.setup_llm_providers(verbose)
+            report = generate_pr_summary_from_data(
+                pr_data=pr_data,
+                providers=providers,
+                stream=stream,
+                verbose=verbose,
+                write=write,
+                timeout=timeout,
+                hedge_after=hedge_after,
+            )
+            checkpoint.save_stage("summary", report)
+            checkpoint.save_summary(
+                report, f"{pr_data['stats']['date_range']['end']}-{days}d"
+            )
 
         if share:
             if verbose:
@@ -66,6 +151,8 @@ def summary(
                 console.print(f"[bold red]error:[/] Slack API error: {str(e)}")
                 raise e
 
+    except typer.Exit:
+        raise
     except Exception as e:
         console.print(f"[bold red]error:[/] {str(e)}")
         raise typer.Exit(1)
@@ -0,0 +1,66 @@
+from pathlib import Path
+
+import typer
+from rich.console import Console
+
+from pr_pulse.constants import CACHE_RETENTION_DAYS
+from pr_pulse.core.cache import export_snapshot, import_snapshot
+
+app = typer.Typer(
+    help="Export and import cached PR data snapshots",
+    add_completion=False,
+)
+console = Console()
+
+
+@app.callback(invoke_without_command=True)
+def main(ctx: typer.Context):
+    if ctx.invoked_subcommand is None:
+        typer.echo(ctx.get_help())
+
+
+@app.command("export")
+def export(
+    output_file: Path = typer.Argument(
+        Path("pr-pulse-cache.json.gz"), help="Path of the snapshot file to write"
+    ),
+    retention_days: int = typer.Option(
+        CACHE_RETENTION_DAYS,
+        "--retention-days",
+        help="Drop PRs and summaries older than this many days from the snapshot and the local store",
+    ),
+    verbose: bool = typer.Option(
+        False, "--verbose", "-v", help="Show detailed progress logs"
+    ),
+):
+    """Pack fetched PR data and generated summaries into a snapshot file"""
+    try:
+        counts = export_snapshot(output_file, retention_days, verbose)
+        console.print(
+            f"[bold green]success:[/] exported {counts['prs']} PRs and "
+            f"{counts['summaries']} summaries from {counts['repos']} repositories"
+        )
+    except Exception as e:
+        console.print(f"[bold red]error:[/] {str(e)}")
+        raise typer.Exit(1)
+
+
+@app.command("import")
+def import_(
+    input_file: Path = typer.Argument(
+        Path("pr-pulse-cache.json.gz"), help="Path of the snapshot file to read"
+    ),
+    verbose: bool = typer.Option(
+        False, "--verbose", "-v", help="Show detailed progress logs"
+    ),
+):
+    """Restore fetched PR data and generated summaries from a snapshot file"""
+    try:
+        counts = import_snapshot(input_file, verbose)
+        console.print(
+            f"[bold green]success:[/] imported {counts['prs']} PRs and "
+            f"{counts['summaries']} summaries for {counts['repos']} repositories"
+        )
+    except Exception as e:
+        console.print(f"[bold red]error:[/] {str(e)}")
+        raise typer.Exit(1)
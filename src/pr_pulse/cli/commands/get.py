@@ -5,8 +5,10 @@ from rich.console import Console
 
 from pr_pulse.constants import OutputFormat
 from pr_pulse.core import github
-from pr_pulse.core.clients import setup_github_client
+from pr_pulse.core.checkpoint import RunCheckpoint, setup_run_checkpoint
+from pr_pulse.core.clients import setup_github_client, setup_github_pool
 from pr_pulse.core.fio import write_json_to_file
+from pr_pulse.core.planner import display_plan_table, plan_run
 
 app = typer.Typer(
     help="Get PR data from GitHub",
@@ -123,31 +125,91 @@ def details(
         "-w",
         help="Write JSON output to a file (pass '-f json' to enable)",
     ),
+    collapse_noise: bool = typer.Option(
+        False,
+        "--collapse-noise/--keep-noise",
+        help="Collapse bot/noise PRs (dependency bumps, releases) into one summary record",
+    ),
+    resume: bool = typer.Option(
+        False, "--resume", help="Resume the last failed run, skipping completed work"
+    ),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Refetch PRs instead of reusing stored records (picks up new comments and edits)",
+    ),
+    plan: bool = typer.Option(
+        False,
+        "--plan",
+        help="Only estimate API calls, wall time and check they fit the budget",
+    ),
+    full: bool = typer.Option(
+        False, "--full", help="Show full PR descriptions instead of a one-line preview"
+    ),
+    pager: bool = typer.Option(
+        False,
+        "--pager",
+        help="Page table output with full descriptions (opens once all PRs are fetched)",
+    ),
     verbose: bool = typer.Option(
         False, "--verbose", "-v", help="Show detailed progress logs"
     ),
 ):
     """Get details of all merged pull requests over the past specified number of days"""
     try:
-        repository, g = setup_github_client(repo, verbose)
-
-        result = github.get_prs_details_data(repository, g, repo, days, verbose)
+        pool = setup_github_pool(repo, verbose)
+
+        if plan:
+            run_plan = plan_run(
+                pool,
+                repo,
+                days,
+                collapse_noise,
+                RunCheckpoint(repo, days),
+                verbose,
+            )
+            display_plan_table(run_plan, include_generation=False)
+            if not run_plan["fits_rate_limit"]:
+                raise typer.Exit(1)
+            return
+
+        checkpoint = setup_run_checkpoint(repo, days, resume, refresh, verbose)
 
         if output_format.lower() == OutputFormat.table:
-            github.display_pr_details_summary_table(result["pr_details"], repo, days)
+            run_info, records = github.stream_prs_details_data(
+                pool,
+                repo,
+                days,
+                verbose,
+                collapse_noise,
+                checkpoint,
+            )
+            if pager:
+                github.page_pr_details_summary_table(
+                    records, repo, days, run_info["noise"]
+                )
+            else:
+                github.display_pr_details_summary_table(
+                    records, repo, days, run_info["noise"], full_descriptions=full
+                )
         else:
-            # Exclude the pr_details key which contains the actual PR objects
-            output = {
-                "stats": result["stats"],
-                "pull_requests": result["pull_requests"],
-            }
-            json_output = json.dumps(output)
+            result = github.get_prs_details_data(
+                pool,
+                repo,
+                days,
+                verbose,
+                collapse_noise,
+                checkpoint,
+            )
+            json_output = json.dumps(result)
 
             if write:
                 write_json_to_file(json_output, "pr-pulse-summary", verbose)
 
             print(json_output)
 
+    except typer.Exit:
+        raise
     except Exception as e:
         console.print(f"[bold red]error:[/] {str(e)}")
         raise typer.Exit(1)
@@ -0,0 +1,41 @@
+import typer
+from rich.console import Console
+
+from pr_pulse.constants import MCPTransport
+
+app = typer.Typer(
+    help="Serve PR data to agents over the Model Context Protocol",
+    add_completion=False,
+)
+console = Console()
+
+
+@app.callback(invoke_without_command=True)
+def main(ctx: typer.Context):
+    if ctx.invoked_subcommand is None:
+        typer.echo(ctx.get_help())
+
+
+@app.command()
+def serve(
+    transport: MCPTransport = typer.Option(
+        MCPTransport.stdio,
+        "--transport",
+        "-t",
+        help="MCP transport",
+        show_choices=True,
+        case_sensitive=False,
+    ),
+):
+    """Run a long-lived MCP server backed by a warm in-memory PR index"""
+    try:
+        import mcp  # noqa: F401
+    except ImportError:
+        console.print(
+            "[bold red]error:[/] MCP support is not installed, install 'pr-pulse[mcp]'"
+        )
+        raise typer.Exit(1)
+
+    from pr_pulse.core.server import create_mcp_server
+
+    create_mcp_server().run(transport.value)
@@ -2,12 +2,31 @@ from functools import lru_cache
 
 from pydantic_settings import BaseSettings
 
+from pr_pulse.constants import (
+    LLM_FALLBACK_MODELS,
+    LLM_MODEL,
+    NOISE_AUTHOR_PATTERNS,
+    NOISE_LABELS,
+    NOISE_TITLE_PATTERNS,
+)
+
 
 class Config(BaseSettings):
     github_token: str | None = None
+    github_tokens: list[str] = []
+    github_app_id: int | None = None
+    github_app_private_key: str | None = None
+    github_app_installation_ids: list[int] = []
     genai_api_key: str | None = None
     slack_webhook_url: str | None = None
+    llm_model: str = LLM_MODEL
+    llm_fallback_models: list[str] = LLM_FALLBACK_MODELS
+    max_prompt_tokens: int = 1_000_000
+    run_dir: str = ".pr-pulse/runs"
     verbose: bool = False
+    noise_author_patterns: list[str] = NOISE_AUTHOR_PATTERNS
+    noise_title_patterns: list[str] = NOISE_TITLE_PATTERNS
+    noise_labels: list[str] = NOISE_LABELS
 
 
 @lru_cache
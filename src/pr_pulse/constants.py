@@ -6,8 +6,114 @@ class OutputFormat(str, Enum):
     json = "json"
 
 
+class MCPTransport(str, Enum):
+    stdio = "stdio"
+    sse = "sse"
+    streamable_http = "streamable-http"
+
+
 MAX_COMMENTS = 5
+DESCRIPTION_PREVIEW_CHARS = 120
 BATCH_SIZE = 8
+# REST calls per PR record: pull request, comment count and first comment page
+PR_FETCH_REQUESTS = 3
+RATE_LIMIT_RESERVE = 50
+SEARCH_PAGE_SIZE = 30
+COMMENT_TOKENS_PER_PR = 150
+MAX_OUTPUT_TOKENS = 8192
+INDEX_MAX_ENTRIES = 4096
+INDEX_TTL = 900.0
+CACHE_SNAPSHOT_FORMAT = "pr-pulse-cache"
+CACHE_SNAPSHOT_VERSION = 1
+CACHE_RETENTION_DAYS = 90
+CHARS_PER_TOKEN = 4
+LLM_MODEL = "gemini-2.0-flash"
+LLM_FALLBACK_MODELS = ["gemini-2.0-flash-lite"]
+LLM_REQUEST_TIMEOUT = 120.0
+LLM_HEDGE_AFTER = 15.0
+
+# default rules for collapsing bot/noise PRs (matched case-insensitively)
+NOISE_AUTHOR_PATTERNS = [
+    r"^dependabot(\[bot\])?$",
+    r"^renovate(\[bot\])?$",
+    r"^release-please(\[bot\])?$",
+    r"^github-actions(\[bot\])?$",
+]
+NOISE_TITLE_PATTERNS = [
+    r"^(build|chore|fix)\(deps(-dev)?\):",
+    r"^bump \S+ ",
+    r"^update dependency ",
+    r"^chore(\(\S+\))?: release ",
+]
+NOISE_LABELS = ["dependencies", "autorelease: pending", "autorelease: tagged"]
+CLUSTER_SIMILARITY_THRESHOLD = 0.2
+CLUSTER_HASH_FEATURES = 2**12
+CLUSTER_DESCRIPTION_CHARS = 280
+CLUSTER_MAX_SIZE = 5
+CLUSTER_TEMPLATE_PATTERNS = [
+    # PR template boilerplate shared by unrelated PRs: HTML comments,
+    # markdown headings and checklist items
+    r"(?s)<!--.*?-->",
+    r"(?m)^\s*#+\s.*$",
+    r"(?m)^\s*[-*]\s*\[[ xX]\].*$",
+]
+CLUSTER_STOPWORDS = {
+    # conventional commit prefixes and common PR template words
+    "feat",
+    "fix",
+    "chore",
+    "docs",
+    "refactor",
+    "test",
+    "tests",
+    "ci",
+    "build",
+    "perf",
+    "style",
+    "the",
+    "and",
+    "for",
+    "with",
+    "this",
+    "that",
+    "from",
+    "into",
+    "are",
+    "was",
+    "not",
+    "pr",
+    "summary",
+    "description",
+    "changes",
+    "plan",
+    # generic verbs and filler common to unrelated PR titles
+    "add",
+    "adds",
+    "added",
+    "update",
+    "updated",
+    "remove",
+    "removed",
+    "handle",
+    "improve",
+    "support",
+    "use",
+    "using",
+    "make",
+    "allow",
+    "new",
+    "now",
+    "when",
+    "during",
+    "via",
+    "all",
+    "can",
+    "should",
+}
+DEPENDENCY_TITLE_PATTERNS = [
+    r"\bbump (?:the )?(\S+) (?:from|to|group)\b",
+    r"\bupdate (?:dependency |module |plugin )?(\S+?) (?:to|from|digest|monorepo|action)\b",
+]
 REPORT_PROMPT = """Generate an executive summary of the pull request activity for the `{repository}` repository over the past {days_analyzed} days.
 
 Start with a brief overview stating the total number of merged PRs and end with a 👏 emoji.
@@ -25,6 +131,10 @@ For each significant change:
 - Note any dependencies or related work
 - Include the PR URL in markdown format [PR #{{number}}](url) at the end of each bullet point
 
+Related PRs may be grouped into a single cluster entry with a `pull_requests` list. Treat a cluster as one change and include the URL of every PR in the cluster.
+
+Automated PRs (dependency bumps, release PRs) may be collapsed into a single `noise` record. Do not list them individually, mention them in one sentence in the closing paragraph instead.
+
 Conclude with a brief paragraph summarizing other notable changes and end with a 🙌 emoji.
 
 Use professional, technical language with Markdown formatting.
@@ -0,0 +1,149 @@
+import datetime
+import gzip
+import hashlib
+import json
+import pathlib
+from typing import Any
+
+from rich.console import Console
+
+from pr_pulse.config import get_config
+from pr_pulse.constants import CACHE_SNAPSHOT_FORMAT, CACHE_SNAPSHOT_VERSION
+
+from .checkpoint import compact_repo_store
+
+console = Console()
+
+
+def compute_checksum(payload: dict[str, Any]) -> str:
+    """Computes the SHA-256 checksum of a snapshot payload."""
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def collect_store_payload(run_dir: pathlib.Path) -> dict[str, Any]:
+    """Collects the stored PR records and summaries of every repository."""
+    repos = {}
+
+    for repo_path in sorted(p for p in run_dir.iterdir() if p.is_dir()):
+        prs = [
+            json.loads(path.read_text())
+            for path in sorted((repo_path / "prs").glob("*.json"))
+        ]
+        summaries = {
+            path.stem: path.read_text()
+            for path in sorted((repo_path / "summaries").glob("*.md"))
+        }
+
+        if prs or summaries:
+            repos[repo_path.name] = dict(prs=prs, summaries=summaries)
+
+    return dict(repos=repos)
+
+
+def export_snapshot(
+    output_file: pathlib.Path,
+    retention_days: int,
+    verbose: bool = get_config().verbose,
+) -> dict[str, int]:
+    """Packs the local PR store into a compressed, versioned and checksummed snapshot.
+
+    The local store is compacted to the retention window first, so the
+    snapshot and the store hold the same entries.
+    """
+    run_dir = pathlib.Path(get_config().run_dir)
+
+    if not run_dir.exists():
+        payload = dict(repos={})
+    else:
+        removed = sum(
+            compact_repo_store(repo_path, retention_days)
+            for repo_path in run_dir.iterdir()
+            if repo_path.is_dir()
+        )
+        if verbose:
+            console.print(
+                f"[bold blue]pruned[/] {removed} stored entries past retention"
+            )
+            console.print(f"[bold blue]collecting[/] stored data from {run_dir}...")
+        payload = collect_store_payload(run_dir)
+    snapshot = dict(
+        format=CACHE_SNAPSHOT_FORMAT,
+        version=CACHE_SNAPSHOT_VERSION,
+        created_at=datetime.datetime.now().isoformat(timespec="seconds"),
+        retention_days=retention_days,
+        sha256=compute_checksum(payload),
+        payload=payload,
+    )
+    output_file.write_bytes(gzip.compress(json.dumps(snapshot).encode()))
+
+    counts = dict(
+        repos=len(payload["repos"]),
+        prs=sum(len(repo["prs"]) for repo in payload["repos"].values()),
+        summaries=sum(len(repo["summaries"]) for repo in payload["repos"].values()),
+    )
+    if verbose:
+        console.print(f"[green]snapshot written to:[/] {output_file}")
+    return counts
+
+
+def read_snapshot(input_file: pathlib.Path) -> dict[str, Any]:
+    """Reads a snapshot file, validating its format, version and checksum."""
+    snapshot = json.loads(gzip.decompress(input_file.read_bytes()))
+
+    if snapshot.get("format") != CACHE_SNAPSHOT_FORMAT:
+        raise ValueError(f"{input_file} is not a pr-pulse cache snapshot")
+    if snapshot.get("version") != CACHE_SNAPSHOT_VERSION:
+        raise ValueError(
+            f"unsupported snapshot version {snapshot.get('version')} "
+            f"(expected {CACHE_SNAPSHOT_VERSION})"
+        )
+    if compute_checksum(snapshot["payload"]) != snapshot.get("sha256"):
+        raise ValueError("snapshot checksum mismatch, the file may be corrupted")
+
+    return snapshot
+
+
+def check_store_name(name: str) -> str:
+    """Validates a snapshot key used as a file or directory name in the store."""
+    if name in ("", ".", "..") or "/" in name or "\\" in name:
+        raise ValueError(f"invalid name {name!r} in snapshot")
+    return name
+
+
+def import_snapshot(
+    input_file: pathlib.Path, verbose: bool = get_config().verbose
+) -> dict[str, int]:
+    """Restores PR records and summaries from a snapshot into the local PR store."""
+    snapshot = read_snapshot(input_file)
+    run_dir = pathlib.Path(get_config().run_dir)
+
+    if verbose:
+        console.print(
+            f"[bold blue]restoring[/] snapshot from {snapshot['created_at']} into {run_dir}..."
+        )
+
+    # snapshot keys become file and directory names, validate all of them
+    # before writing anything so they can never escape the store
+    for repo_key, repo_data in snapshot["payload"]["repos"].items():
+        check_store_name(repo_key)
+        for name in repo_data["summaries"]:
+            check_store_name(name)
+
+    counts = dict(repos=0, prs=0, summaries=0)
+    for repo_key, repo_data in snapshot["payload"]["repos"].items():
+        repo_path = run_dir / repo_key
+        (repo_path / "prs").mkdir(parents=True, exist_ok=True)
+        (repo_path / "summaries").mkdir(parents=True, exist_ok=True)
+
+        for record in repo_data["prs"]:
+            path = repo_path / "prs" / f"{int(record['number'])}.json"
+            path.write_text(json.dumps(record))
+        for name, report in repo_data["summaries"].items():
+            (repo_path / "summaries" / f"{name}.md").write_text(report)
+
+        counts["repos"] += 1
+        counts["prs"] += len(repo_data["prs"])
+        counts["summaries"] += len(repo_data["summaries"])
+
+    return counts
@@ -2,26 +2,26 @@ import json
 from pathlib import Path
 from typing import Any
 
-from google import genai
-from google.genai import types
 from rich.console import Console
 
-from pr_pulse.constants import REPORT_PROMPT
+from pr_pulse.constants import LLM_HEDGE_AFTER, LLM_REQUEST_TIMEOUT, REPORT_PROMPT
 
 from .fio import write_text_to_file
+from .providers import LLMProvider, generate_text
 
 console = Console()
 
 
 def generate_pr_summary_from_data(
     pr_data: dict[str, Any],
-    llm: genai.Client,
-    model: str = "gemini-2.0-flash",
+    providers: list[LLMProvider],
     stream: bool = False,
     verbose: bool = False,
     write: bool = False,
+    timeout: float = LLM_REQUEST_TIMEOUT,
+    hedge_after: float = LLM_HEDGE_AFTER,
 ) -> str:
-    """Generates a PR Pulse insights summary using Gemini AI from PR data directly."""
+    """Generates a PR Pulse insights summary from PR data directly."""
     try:
         repository = pr_data["stats"]["repository"]
         days_analyzed = pr_data["stats"]["days_analyzed"]
@@ -32,30 +32,21 @@ def generate_pr_summary_from_data(
     if verbose:
         console.print("[bold blue]generating[/] summary...")
 
-    generate_content_config = types.GenerateContentConfig(
-        temperature=1,
-        top_p=0.95,
-        top_k=40,
-        max_output_tokens=8192,
-        response_mime_type="text/plain",
+    prompt = REPORT_PROMPT.format(
+        repository=repository,
+        days_analyzed=days_analyzed,
+        input_data=pr_data,
     )
 
-    response = ""
-    response_stream = llm.models.generate_content_stream(
-        model=model,
-        contents=REPORT_PROMPT.format(
-            repository=repository,
-            days_analyzed=days_analyzed,
-            input_data=pr_data,
-        ),
-        config=generate_content_config,
+    response = generate_text(
+        providers,
+        prompt,
+        timeout=timeout,
+        hedge_after=hedge_after,
+        on_chunk=(lambda text: console.print(text, end="")) if stream else None,
+        verbose=verbose,
     )
 
-    for chunk in response_stream:
-        if stream:
-            console.print(chunk.text, end="")
-        response += chunk.text
-
     if not stream:
         console.print(response)
 
@@ -69,13 +60,14 @@ def generate_pr_summary_from_data(
 
 def generate_pr_summary_from_file(
     details_json_file: Path,
-    llm: genai.Client,
-    model: str = "gemini-2.0-flash",
+    providers: list[LLMProvider],
     stream: bool = False,
     verbose: bool = False,
     write: bool = False,
+    timeout: float = LLM_REQUEST_TIMEOUT,
+    hedge_after: float = LLM_HEDGE_AFTER,
 ) -> str:
-    """Generates a PR Pulse insights summary using Gemini AI from a JSON file."""
+    """Generates a PR Pulse insights summary from a JSON file."""
     if verbose:
         console.print("[bold blue]reading[/] input file...")
 
@@ -88,9 +80,10 @@ def generate_pr_summary_from_file(
 
     return generate_pr_summary_from_data(
         pr_data=input_data,
-        llm=llm,
-        model=model,
+        providers=providers,
         stream=stream,
         verbose=verbose,
         write=write,
+        timeout=timeout,
+        hedge_after=hedge_after,
     )
@@ -0,0 +1,148 @@
+import datetime
+import json
+import pathlib
+import shutil
+from typing import Any
+
+from rich.console import Console
+
+from pr_pulse.config import get_config
+from pr_pulse.constants import CACHE_RETENTION_DAYS
+
+console = Console()
+
+
+def compact_repo_store(repo_path: pathlib.Path, retention_days: int) -> int:
+    """Removes stored PR records and summaries older than the retention window.
+
+    Returns the number of removed files.
+    """
+    cutoff = (
+        datetime.datetime.now() - datetime.timedelta(days=retention_days)
+    ).strftime("%Y-%m-%d")
+    removed = 0
+
+    for path in (repo_path / "prs").glob("*.json"):
+        record = json.loads(path.read_text())
+        if record.get("merged_at", record["created_at"])[:10] < cutoff:
+            path.unlink()
+            removed += 1
+
+    # summaries are named '<end date>-<days>d'
+    for path in (repo_path / "summaries").glob("*.md"):
+        if path.stem[:10] < cutoff:
+            path.unlink()
+            removed += 1
+
+    return removed
+
+
+class RunCheckpoint:
+    """Persists fetched PR records and completed pipeline stages of a run.
+
+    PR records are stored per repository and shared across runs, so a new run
+    only fetches PRs that are not already stored. Pipeline stages are stored
+    per run (repository + days window), so a failed run can be resumed.
+    """
+
+    def __init__(self, repo: str, days: int, run_dir: str | None = None):
+        self.repo_path = pathlib.Path(run_dir or get_config().run_dir) / repo.replace(
+            "/", "__"
+        )
+        self.path = self.repo_path / f"{days}d"
+
+    @property
+    def prs_path(self) -> pathlib.Path:
+        return self.repo_path / "prs"
+
+    @property
+    def summaries_path(self) -> pathlib.Path:
+        return self.repo_path / "summaries"
+
+    @property
+    def stages_path(self) -> pathlib.Path:
+        return self.path / "stages"
+
+    def reset(self) -> None:
+        """Removes the checkpointed stages of the run (stored PR records are kept)."""
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def clear_pr_records(self) -> None:
+        """Removes the stored PR records of the repository so they are refetched."""
+        shutil.rmtree(self.prs_path, ignore_errors=True)
+
+    def compact(self, retention_days: int) -> int:
+        """Removes stored PR records and summaries outside the retention window."""
+        return compact_repo_store(self.repo_path, retention_days)
+
+    def _write(self, path: pathlib.Path, data: Any) -> None:
+        # write to a temporary file first so an interrupted write never leaves a
+        # truncated checkpoint behind
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(data))
+        tmp_path.replace(path)
+
+    def is_stage_done(self, stage: str) -> bool:
+        return (self.stages_path / f"{stage}.json").exists()
+
+    def save_stage(self, stage: str, data: Any) -> None:
+        self._write(self.stages_path / f"{stage}.json", data)
+
+    def load_stage(self, stage: str) -> Any:
+        return json.loads((self.stages_path / f"{stage}.json").read_text())
+
+    def save_pr_record(self, record: dict[str, Any]) -> None:
+        self._write(self.prs_path / f"{record['number']}.json", record)
+
+    def save_summary(self, report: str, name: str) -> None:
+        """Archives a generated summary report."""
+        self.summaries_path.mkdir(parents=True, exist_ok=True)
+        (self.summaries_path / f"{name}.md").write_text(report)
+
+    def load_pr_records(self) -> dict[int, dict[str, Any]]:
+        """Loads all checkpointed PR records keyed by PR number."""
+        if not self.prs_path.exists():
+            return {}
+        records = {}
+        for path in self.prs_path.glob("*.json"):
+            record = json.loads(path.read_text())
+            records[record["number"]] = record
+        return records
+
+
+def setup_run_checkpoint(
+    repo: str,
+    days: int,
+    resume: bool = False,
+    refresh: bool = False,
+    verbose: bool = get_config().verbose,
+) -> RunCheckpoint:
+    """Sets up the checkpoint of a run, clearing previous progress unless resuming.
+
+    Stored PR records outside the retention window (never shorter than the
+    run's window) are pruned; with `refresh`, all stored PR records are
+    discarded so comments and description edits are picked up.
+    """
+    checkpoint = RunCheckpoint(repo, days)
+
+    if refresh:
+        if verbose:
+            console.print(f"[bold blue]discarding[/] stored PR records of {repo}")
+        checkpoint.clear_pr_records()
+
+    removed = checkpoint.compact(max(CACHE_RETENTION_DAYS, days))
+    if verbose and removed:
+        console.print(f"[bold blue]pruned[/] {removed} stored entries past retention")
+
+    if resume:
+        if not checkpoint.path.exists():
+            console.print(
+                "[bold yellow]warning:[/] no checkpoint found to resume, starting a new run"
+            )
+        elif verbose:
+            console.print(f"[bold blue]resuming[/] run from {checkpoint.path}")
+    else:
+        checkpoint.reset()
+
+    return checkpoint
@@ -6,6 +6,8 @@ from rich.console import Console
 from slack_sdk.webhook import WebhookClient
 
 from pr_pulse.config import get_config
+from pr_pulse.core.pool import GitHubClientPool, PooledClient
+from pr_pulse.core.providers import GeminiProvider, LLMProvider
 
 console = Console()
 
@@ -35,6 +37,69 @@ def setup_github_client(
         raise typer.Exit(1)
 
 
+def setup_github_pool(
+    repo: str, verbose: bool = get_config().verbose
+) -> GitHubClientPool:
+    """Sets up a pool of GitHub clients from all configured tokens and app installations."""
+    config = get_config()
+    credentials: list[tuple[str, Auth.Auth]] = []
+
+    tokens = [token for token in [config.github_token, *config.github_tokens] if token]
+    for i, token in enumerate(dict.fromkeys(tokens), start=1):
+        credentials.append((f"token #{i}", Auth.Token(token)))
+
+    if config.github_app_id and config.github_app_private_key:
+        app_auth = Auth.AppAuth(config.github_app_id, config.github_app_private_key)
+        for installation_id in config.github_app_installation_ids:
+            credentials.append(
+                (
+                    f"installation {installation_id}",
+                    app_auth.get_installation_auth(installation_id),
+                )
+            )
+
+    if not credentials:
+        console.print(
+            "[bold red]error:[/] GitHub token not provided and not found in config"
+        )
+        raise typer.Exit(1)
+
+    pooled_clients = []
+    for name, auth in credentials:
+        if verbose:
+            console.print(f"[bold blue]authenticating[/] with github ({name})...")
+        g = Github(auth=auth)
+        try:
+            repository = g.get_repo(repo)
+        except Exception as e:
+            console.print(
+                f"[bold yellow]warning:[/] skipping {name}, could not access repository {repo}: {str(e)}"
+            )
+            continue
+
+        remaining, limit = g.rate_limiting
+        pooled_clients.append(
+            PooledClient(
+                name=name,
+                github=g,
+                repository=repository,
+                remaining=remaining,
+                limit=limit,
+                reset_at=g.rate_limiting_resettime,
+            )
+        )
+        if verbose:
+            console.print(
+                f"[bold blue]budget[/] {name}: {remaining}/{limit} requests remaining"
+            )
+
+    if not pooled_clients:
+        console.print(f"[bold red]error:[/] could not find repository {repo}")
+        raise typer.Exit(1)
+
+    return GitHubClientPool(pooled_clients, verbose=verbose)
+
+
 def setup_gemini_client(verbose: bool = get_config().verbose) -> genai.Client:
     """Sets up Gemini client."""
     if not (api_key := get_config().genai_api_key):
@@ -49,6 +114,17 @@ def setup_gemini_client(verbose: bool = get_config().verbose) -> genai.Client:
     return genai.Client(api_key=api_key)
 
 
+def setup_llm_providers(verbose: bool = get_config().verbose) -> list[LLMProvider]:
+    """Sets up LLM providers in fallback order (primary model first)."""
+    client = setup_gemini_client(verbose)
+    models = [get_config().llm_model, *get_config().llm_fallback_models]
+
+    if verbose:
+        console.print(f"[bold blue]using[/] models: {', '.join(models)}")
+
+    return [GeminiProvider(client, model) for model in dict.fromkeys(models)]
+
+
 def setup_slack_webhook_client(verbose: bool = get_config().verbose) -> WebhookClient:
     """Sets up Slack webhook client."""
     if not (webhook_url := get_config().slack_webhook_url):
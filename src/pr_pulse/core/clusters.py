@@ -0,0 +1,168 @@
+import json
+import re
+import zlib
+from typing import Any
+
+import numpy as np
+from rich.console import Console
+
+from pr_pulse.config import get_config
+from pr_pulse.constants import (
+    CLUSTER_DESCRIPTION_CHARS,
+    CLUSTER_HASH_FEATURES,
+    CLUSTER_MAX_SIZE,
+    CLUSTER_SIMILARITY_THRESHOLD,
+    CLUSTER_STOPWORDS,
+    CLUSTER_TEMPLATE_PATTERNS,
+    MAX_COMMENTS,
+)
+
+from .tokens import estimate_tokens
+
+console = Console()
+
+_template_patterns = [re.compile(pattern) for pattern in CLUSTER_TEMPLATE_PATTERNS]
+
+
+def strip_pr_template(text: str) -> str:
+    """Removes PR template boilerplate (HTML comments, headings, checklists)."""
+    for pattern in _template_patterns:
+        text = pattern.sub("", text)
+    return text.strip()
+
+
+def tokenize(text: str) -> list[str]:
+    """Splits text into lowercase word tokens, dropping stopwords and short words.
+
+    Plural endings are stripped so that e.g. 'token' and 'tokens' match.
+    """
+    tokens = []
+    for token in re.findall(r"[a-z0-9_]+", text.lower()):
+        if len(token) <= 2 or token in CLUSTER_STOPWORDS:
+            continue
+        if len(token) > 4 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        if token not in CLUSTER_STOPWORDS:
+            tokens.append(token)
+    return tokens
+
+
+def vectorize_pr_texts(
+    texts: list[str], n_features: int = CLUSTER_HASH_FEATURES
+) -> np.ndarray:
+    """Builds L2-normalised TF-IDF vectors using the hashing trick (no vocabulary).
+
+    The IDF `log((1 + n) / df)` goes to ~0 for words present in every text,
+    so boilerplate shared by all PRs does not make them look related.
+    """
+    counts = np.zeros((len(texts), n_features), dtype=np.float32)
+    for row, text in enumerate(texts):
+        tokens = tokenize(text)
+        # adjacent word pairs reward shared phrases over single shared words
+        for token in tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]:
+            counts[row, zlib.crc32(token.encode()) % n_features] += 1
+
+    doc_freq = np.count_nonzero(counts, axis=0)
+    idf = np.log((1 + len(texts)) / np.maximum(doc_freq, 1))
+    vectors = counts * idf
+
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
+
+
+def find_pr_clusters(
+    pull_requests: list[dict[str, Any]],
+    threshold: float = CLUSTER_SIMILARITY_THRESHOLD,
+    max_size: int = CLUSTER_MAX_SIZE,
+) -> list[list[int]]:
+    """Groups PR indices whose title/description cosine similarity exceeds the threshold.
+
+    Clusters use complete linkage: a PR joins the cluster whose least similar
+    member is still above the threshold, so similarity never chains across
+    unrelated PRs. Clusters are capped at `max_size` PRs.
+    """
+    # titles are repeated to weigh them above descriptions
+    texts = [
+        f"{pr['title']} {pr['title']} {strip_pr_template(pr.get('description', ''))}"
+        for pr in pull_requests
+    ]
+    vectors = vectorize_pr_texts(texts)
+    similarity = vectors @ vectors.T
+
+    clusters: list[list[int]] = []
+    for i in range(len(pull_requests)):
+        best, best_score = None, threshold
+        for cluster in clusters:
+            if len(cluster) >= max_size:
+                continue
+            score = min(similarity[i, j] for j in cluster)
+            if score >= best_score:
+                best, best_score = cluster, score
+        if best is None:
+            clusters.append([i])
+        else:
+            best.append(i)
+
+    return clusters
+
+
+def create_cluster_entry(pull_requests: list[dict[str, Any]]) -> dict[str, Any]:
+    """Merges related PR records into one compact prompt entry keeping all PR links."""
+    primary = max(pull_requests, key=lambda pr: len(pr.get("description", "")))
+
+    related_descriptions = [
+        strip_pr_template(pr["description"])[:CLUSTER_DESCRIPTION_CHARS]
+        for pr in pull_requests
+        if pr is not primary and strip_pr_template(pr.get("description", ""))
+    ]
+    # comments are already capped per PR when fetched, keep them for every member
+    comments = [
+        comment
+        for pr in pull_requests
+        for comment in pr.get("comments", {}).get("items", [])[:MAX_COMMENTS]
+    ]
+
+    return dict(
+        cluster_size=len(pull_requests),
+        title=primary["title"],
+        authors=sorted({pr["author"] for pr in pull_requests}),
+        pull_requests=[
+            dict(number=pr["number"], title=pr["title"], url=pr["url"])
+            for pr in pull_requests
+        ],
+        description=primary.get("description", ""),
+        related_descriptions=related_descriptions,
+        comments=comments,
+    )
+
+
+def cluster_pr_data(
+    pr_data: dict[str, Any],
+    threshold: float = CLUSTER_SIMILARITY_THRESHOLD,
+    verbose: bool = get_config().verbose,
+) -> dict[str, Any]:
+    """Replaces related PR records in PR data with merged cluster entries."""
+    pull_requests = pr_data["pull_requests"]
+    if len(pull_requests) < 2:
+        return pr_data
+
+    if verbose:
+        console.print("[bold blue]clustering[/] related pull requests...")
+
+    entries = []
+    for indices in find_pr_clusters(pull_requests, threshold):
+        if len(indices) == 1:
+            entries.append(pull_requests[indices[0]])
+        else:
+            entries.append(create_cluster_entry([pull_requests[i] for i in indices]))
+
+    if verbose:
+        saved_tokens = estimate_tokens(json.dumps(pull_requests)) - estimate_tokens(
+            json.dumps(entries)
+        )
+        console.print(
+            f"[bold blue]clustered[/] {len(pull_requests)} PRs into {len(entries)} entries "
+            f"(~{saved_tokens} prompt tokens saved)"
+        )
+
+    return {**pr_data, "pull_requests": entries}
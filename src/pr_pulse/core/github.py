@@ -1,15 +1,23 @@
 import asyncio
 import datetime
+import itertools
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 from github import Github
 from github.PullRequest import PullRequest
 from github.Repository import Repository
+from rich import box
 from rich.console import Console
 from rich.table import Table
+from rich.text import Text
 
 from pr_pulse.config import get_config
-from pr_pulse.constants import BATCH_SIZE, MAX_COMMENTS
+from pr_pulse.constants import BATCH_SIZE, DESCRIPTION_PREVIEW_CHARS, MAX_COMMENTS
+
+from .checkpoint import RunCheckpoint
+from .noise import collapse_noise_prs
+from .pool import GitHubClientPool
 
 console = Console()
 
@@ -74,16 +82,46 @@ def get_pr_details(
         raise e
 
 
-async def get_pr_details_batch(
-    repository: Repository, pr_numbers: list[int], verbose: bool = get_config().verbose
-) -> list[PullRequest]:
-    """Fetches details of pull requests in a batch."""
+def fetch_pr_record(
+    repository: Repository,
+    pr_number: int,
+    verbose: bool = get_config().verbose,
+    checkpoint: RunCheckpoint | None = None,
+) -> dict[str, Any]:
+    """Fetches and formats a single pull request, checkpointing the record."""
+    pr = get_pr_details(repository, pr_number, verbose)
+    record = format_pr_data(pr, include_comments=True)
+    if checkpoint:
+        checkpoint.save_pr_record(record)
+    return record
+
+
+def fetch_pooled_pr_record(
+    pool: GitHubClientPool,
+    pr_number: int,
+    verbose: bool = get_config().verbose,
+    checkpoint: RunCheckpoint | None = None,
+) -> dict[str, Any]:
+    """Fetches a single pull request through the pooled client with the most
+    remaining rate-limit budget.
+    """
+    with pool.lease() as repository:
+        return fetch_pr_record(repository, pr_number, verbose, checkpoint)
+
+
+async def get_pr_records_batch(
+    pool: GitHubClientPool,
+    pr_numbers: list[int],
+    verbose: bool = get_config().verbose,
+    checkpoint: RunCheckpoint | None = None,
+) -> list[dict[str, Any]]:
+    """Fetches formatted records of pull requests in a batch."""
     results = []
 
     for i in range(0, len(pr_numbers), BATCH_SIZE):
         batch = pr_numbers[i : i + BATCH_SIZE]
         batch_tasks = [
-            asyncio.to_thread(get_pr_details, repository, pr_num, verbose)
+            asyncio.to_thread(fetch_pooled_pr_record, pool, pr_num, verbose, checkpoint)
             for pr_num in batch
         ]
         batch_results = await asyncio.gather(*batch_tasks)
@@ -102,6 +140,7 @@ def format_pr_data(pr: PullRequest, include_comments: bool = True) -> dict[str,
         created_at=format_date(pr.created_at),
         url=pr.html_url,
         description=pr.body or "",
+        labels=[label.name for label in pr.labels],
     )
 
     if pr.merged:
@@ -182,6 +221,45 @@ def escape_rich_markup(text: str) -> str:
     return text.replace("[", "\\[").replace("]", "\\]")
 
 
+def truncate_description(body: str, max_chars: int = DESCRIPTION_PREVIEW_CHARS) -> str:
+    """Collapses a PR description into a single-line preview."""
+    preview = " ".join(body.split())
+    if len(preview) > max_chars:
+        return preview[: max_chars - 1] + "…"
+    return preview
+
+
+def create_stream_table(
+    columns: list[tuple[str, dict[str, Any]]],
+    show_header: bool = False,
+    title: str | None = None,
+) -> Table:
+    """Creates a table with fixed column widths so separately printed rows align."""
+    table = Table(
+        title=title,
+        show_header=show_header,
+        box=box.SIMPLE_HEAD,
+        show_edge=False,
+        padding=(0, 1),
+        expand=True,
+    )
+    for name, options in columns:
+        table.add_column(name, **options)
+    return table
+
+
+def print_stream_header(title: str, columns: list[tuple[str, dict[str, Any]]]):
+    """Prints the title and header of a streamed table."""
+    console.print(create_stream_table(columns, show_header=True, title=title))
+
+
+def print_stream_row(columns: list[tuple[str, dict[str, Any]]], values: list):
+    """Prints a single row of a streamed table immediately."""
+    row_table = create_stream_table(columns)
+    row_table.add_row(*values)
+    console.print(row_table)
+
+
 def display_description(body: str, title: str = "description"):
     """Displays a PR description in a table."""
     if not body:
@@ -196,29 +274,33 @@ def display_description(body: str, title: str = "description"):
 
 
 def display_comments(comments, max_comments: int = MAX_COMMENTS):
-    """Displays comments in a table."""
+    """Displays comments as a streamed table, printing each row as it is fetched."""
     if comments.totalCount == 0:
         console.print("\n[italic]no comments found[/]")
         return
 
     comment_display_count = min(max_comments, comments.totalCount)
-    comments_table = Table(
-        title=f"comments (showing {comment_display_count} of {comments.totalCount})"
-    )
-    comments_table.add_column("author", style="cyan")
-    comments_table.add_column("date", style="yellow")
-    comments_table.add_column("comment", style="green")
+    columns = [
+        ("author", dict(style="cyan", width=18, no_wrap=True, overflow="ellipsis")),
+        ("date", dict(style="yellow", width=16, no_wrap=True)),
+        ("comment", dict(style="green", ratio=1)),
+    ]
 
+    console.print("\n")
+    print_stream_header(
+        f"comments (showing {comment_display_count} of {comments.totalCount})",
+        columns,
+    )
     for comment in comments[:max_comments]:
-        comments_table.add_row(
-            comment.user.login,
-            format_date(comment.created_at),
-            comment.body,
+        print_stream_row(
+            columns,
+            [
+                comment.user.login,
+                format_date(comment.created_at),
+                Text(comment.body or ""),
+            ],
         )
 
-    console.print("\n")
-    console.print(comments_table)
-
 
 def display_pr_details_table(pr: PullRequest, show_comments: bool = True):
     """Displays pull request details in table format (comments are optional)."""
@@ -244,19 +326,16 @@ def display_pr_details_table(pr: PullRequest, show_comments: bool = True):
         display_comments(pr.get_issue_comments())
 
 
-def get_prs_details_data(
-    repository: Repository, g: Github, repo: str, days: int, verbose: bool = False
+def search_pr_numbers(
+    g: Github, repo: str, days: int, verbose: bool = False, collapse_noise: bool = True
 ) -> dict[str, Any]:
-    """Gets details for multiple pull requests within a time frame."""
-    pulls = search_merged_pull_requests(g, repo, days, verbose)
-
-    if verbose:
-        console.print("[bold blue]fetching[/] details for each PR...")
+    """Searches merged pull requests and returns run stats, PR numbers and noise record."""
+    pulls = list(search_merged_pull_requests(g, repo, days, verbose))
+    pr_count = len(pulls)
 
-    pr_numbers = [pull.number for pull in pulls]
-    pr_count = len(pr_numbers)
-
-    pr_details = asyncio.run(get_pr_details_batch(repository, pr_numbers, verbose))
+    noise = None
+    if collapse_noise:
+        pulls, noise = collapse_noise_prs(pulls, verbose)
 
     start_date, end_date = get_date_range(days)
     stats = dict(
@@ -269,31 +348,162 @@ def get_prs_details_data(
         ),
     )
 
-    formatted_prs = [format_pr_data(pr, include_comments=True) for pr in pr_details]
+    if noise:
+        stats["collapsed_prs"] = noise["total_prs"]
+
+    return dict(stats=stats, pr_numbers=[pull.number for pull in pulls], noise=noise)
+
+
+def iter_pr_records(
+    pool: GitHubClientPool,
+    pr_numbers: list[int],
+    verbose: bool = get_config().verbose,
+    checkpoint: RunCheckpoint | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Fetches formatted PR records, yielding each batch as soon as it completes."""
+    for i in range(0, len(pr_numbers), BATCH_SIZE):
+        batch = pr_numbers[i : i + BATCH_SIZE]
+        yield from asyncio.run(get_pr_records_batch(pool, batch, verbose, checkpoint))
+
+
+def stream_prs_details_data(
+    pool: GitHubClientPool,
+    repo: str,
+    days: int,
+    verbose: bool = False,
+    collapse_noise: bool = True,
+    checkpoint: RunCheckpoint | None = None,
+) -> tuple[dict[str, Any], Iterator[dict[str, Any]]]:
+    """Searches merged pull requests and returns run info with a lazy PR record iterator.
+
+    When `collapse_noise` is enabled, bot/noise PRs are grouped into a single
+    summary record before any detail fetch. With a `checkpoint`, the search
+    result and every fetched PR record are persisted as they complete, and
+    work already present in the checkpoint is skipped. Checkpointed records
+    are yielded first, followed by fetched records in arrival order.
+    """
+    # `get details` keeps noise PRs by default while `analyze summary` collapses
+    # them, so a resumed run must not pick up the other command's search result
+    search_stage = "search" if collapse_noise else "search-all"
+    if checkpoint and checkpoint.is_stage_done(search_stage):
+        search = checkpoint.load_stage(search_stage)
+        if verbose:
+            console.print("[bold blue]skipping[/] search (loaded from checkpoint)")
+    else:
+        search = search_pr_numbers(
+            pool.best().github, repo, days, verbose, collapse_noise
+        )
+        if checkpoint:
+            checkpoint.save_stage(search_stage, search)
+
+    pr_numbers = search["pr_numbers"]
+    records = checkpoint.load_pr_records() if checkpoint else {}
+    cached = [records[number] for number in pr_numbers if number in records]
+    missing = [number for number in pr_numbers if number not in records]
+
+    if verbose:
+        if cached:
+            console.print(
+                f"[bold blue]skipping[/] {len(cached)} PRs "
+                "already fetched (loaded from checkpoint)"
+            )
+        console.print("[bold blue]fetching[/] details for each PR...")
 
-    return {"stats": stats, "pull_requests": formatted_prs, "pr_details": pr_details}
+    run_info = dict(stats=search["stats"], noise=search["noise"], pr_numbers=pr_numbers)
+    return run_info, itertools.chain(
+        cached, iter_pr_records(pool, missing, verbose, checkpoint)
+    )
 
 
-def display_pr_details_summary_table(pr_details, repo: str, days: int):
-    """Displays summary table for multiple PR details."""
-    pr_count = len(pr_details)
-    summary_table = Table(title=f"PR summary for {repo} (last {days} days)")
-    summary_table.add_column("#", style="cyan", justify="right")
-    summary_table.add_column("title", style="green")
-    summary_table.add_column("author", style="yellow")
-    summary_table.add_column("merged at", style="magenta")
+def get_prs_details_data(
+    pool: GitHubClientPool,
+    repo: str,
+    days: int,
+    verbose: bool = False,
+    collapse_noise: bool = True,
+    checkpoint: RunCheckpoint | None = None,
+) -> dict[str, Any]:
+    """Gets details for multiple pull requests within a time frame."""
+    run_info, records = stream_prs_details_data(
+        pool, repo, days, verbose, collapse_noise, checkpoint
+    )
+    records_by_number = {record["number"]: record for record in records}
+
+    return {
+        "stats": run_info["stats"],
+        "pull_requests": [
+            records_by_number[number] for number in run_info["pr_numbers"]
+        ],
+        "noise": run_info["noise"],
+    }
+
+
+def display_pr_details_summary_table(
+    pull_requests: Iterable[dict[str, Any]],
+    repo: str,
+    days: int,
+    noise: dict[str, Any] | None = None,
+    full_descriptions: bool = False,
+):
+    """Displays PR records as a streamed summary table.
+
+    Rows are printed as records arrive instead of being buffered, with a
+    one-line description preview (or the full description with
+    `full_descriptions`), so output starts immediately and memory stays flat.
+    """
+    columns = [
+        ("#", dict(style="cyan", justify="right", width=6)),
+        ("title", dict(style="green", ratio=2)),
+        ("author", dict(style="yellow", width=18, no_wrap=True, overflow="ellipsis")),
+        ("merged at", dict(style="magenta", width=16, no_wrap=True)),
+        ("description", dict(ratio=3, no_wrap=True, overflow="ellipsis")),
+    ]
+    print_stream_header(f"PR summary for {repo} (last {days} days)", columns)
+
+    pr_count = 0
+    for pr in pull_requests:
+        pr_count += 1
+        description = pr["description"]
+        print_stream_row(
+            columns,
+            [
+                str(pr["number"]),
+                Text(pr["title"]),
+                pr["author"],
+                pr.get("merged_at", "Not merged"),
+                Text("" if full_descriptions else truncate_description(description)),
+            ],
+        )
+        if full_descriptions:
+            display_description(description, title=f"PR #{pr['number']} Description")
 
-    for pr in pr_details:
-        summary_table.add_row(
-            str(pr.number),
-            pr.title,
-            pr.user.login,
-            format_date(pr.merged_at) if pr.merged else "Not merged",
+    if noise:
+        console.print(
+            f"\n[bold]total PRs:[/] {pr_count + noise['total_prs']} "
+            f"({pr_count} listed, {noise['total_prs']} collapsed)"
+        )
+        console.print(f"[bold]collapsed bot/noise PRs:[/] {noise['summary']}")
+    else:
+        console.print(f"\n[bold]total PRs:[/] {pr_count}")
+    if not full_descriptions:
+        console.print(
+            "[italic]descriptions truncated, pass --full to expand or --pager to page through them[/]"
         )
 
-    console.print(summary_table)
-    console.print(f"\n[bold]total PRs:[/] {pr_count}")
 
-    for pr in pr_details:
-        console.print(f"\n[bold]===== PR #{pr.number}: {pr.title} =====\n[/]")
-        display_description(pr.body, title=f"PR #{pr.number} Description")
+def page_pr_details_summary_table(
+    pull_requests: Iterable[dict[str, Any]],
+    repo: str,
+    days: int,
+    noise: dict[str, Any] | None = None,
+):
+    """Displays PR records with full descriptions in a pager.
+
+    The pager shows its output in one go once closed, so records are fetched
+    (with progress logs visible) before it opens rather than inside it.
+    """
+    records = list(pull_requests)
+    with console.pager(styles=True):
+        display_pr_details_summary_table(
+            records, repo, days, noise, full_descriptions=True
+        )
@@ -0,0 +1,86 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from typing import Any
+
+from pr_pulse.constants import INDEX_MAX_ENTRIES, INDEX_TTL
+
+
+class PRIndex:
+    """Thread-safe in-memory LRU index of PR data with request coalescing.
+
+    Entries are keyed by tuples such as `("pr", repo, number)` and expire after
+    `ttl` seconds. Concurrent loads of the same missing key share one loader
+    call instead of each hitting GitHub.
+    """
+
+    def __init__(self, max_entries: int = INDEX_MAX_ENTRIES, ttl: float = INDEX_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._in_flight: dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _lookup(self, key: Hashable) -> tuple[bool, Any]:
+        # must be called with the lock held
+        if key not in self._entries:
+            return False, None
+        loaded_at, value = self._entries[key]
+        if time.monotonic() - loaded_at > self.ttl:
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    def get(self, key: Hashable) -> tuple[bool, Any]:
+        """Returns whether the key is indexed and its value."""
+        with self._lock:
+            found, value = self._lookup(key)
+            if found:
+                self.hits += 1
+            return found, value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Adds or refreshes an entry, evicting the least recently used ones."""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Returns the indexed value, loading it once for all concurrent callers."""
+        with self._lock:
+            found, value = self._lookup(key)
+            if found:
+                self.hits += 1
+                return value
+            future = self._in_flight.get(key)
+            owner = future is None
+            if owner:
+                self.misses += 1
+                future = self._in_flight[key] = Future()
+
+        if not owner:
+            return future.result()
+
+        try:
+            value = loader()
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            self.put(key, value)
+            future.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(entries=len(self._entries), hits=self.hits, misses=self.misses)
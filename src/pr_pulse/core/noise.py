@@ -0,0 +1,165 @@
+import json
+import re
+from typing import Any
+
+from rich.console import Console
+
+from pr_pulse.config import get_config
+from pr_pulse.constants import DEPENDENCY_TITLE_PATTERNS
+
+from .tokens import estimate_tokens
+
+console = Console()
+
+
+def compile_patterns(patterns: list[str]) -> list[re.Pattern]:
+    """Compiles a list of regex patterns for case-insensitive matching."""
+    return [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+
+
+def load_noise_matchers() -> tuple[list[re.Pattern], list[re.Pattern], set[str]]:
+    """Loads the configured noise author patterns, title patterns and labels."""
+    config = get_config()
+    return (
+        compile_patterns(config.noise_author_patterns),
+        compile_patterns(config.noise_title_patterns),
+        {label.lower() for label in config.noise_labels},
+    )
+
+
+def matches_noise(
+    author: str,
+    title: str,
+    pr_labels: list[str],
+    author_patterns: list[re.Pattern],
+    title_patterns: list[re.Pattern],
+    labels: set[str],
+) -> bool:
+    """Checks whether a PR's author, title or labels match the noise filters."""
+    if any(pattern.search(author) for pattern in author_patterns):
+        return True
+    if any(pattern.search(title) for pattern in title_patterns):
+        return True
+    return any(label.lower() in labels for label in pr_labels)
+
+
+def is_noise_pr(
+    pull,
+    author_patterns: list[re.Pattern],
+    title_patterns: list[re.Pattern],
+    labels: set[str],
+) -> bool:
+    """Checks whether a PR search result is a bot/noise PR (author, title or label match)."""
+    return matches_noise(
+        pull.user.login,
+        pull.title,
+        [label.name for label in pull.labels],
+        author_patterns,
+        title_patterns,
+        labels,
+    )
+
+
+def is_noise_record(
+    record: dict[str, Any],
+    author_patterns: list[re.Pattern],
+    title_patterns: list[re.Pattern],
+    labels: set[str],
+) -> bool:
+    """Checks whether a stored PR record is a bot/noise PR."""
+    return matches_noise(
+        record["author"],
+        record["title"],
+        record.get("labels", []),
+        author_patterns,
+        title_patterns,
+        labels,
+    )
+
+
+def extract_dependency_name(title: str) -> str | None:
+    """Extracts the bumped package name from a dependency update PR title."""
+    for pattern in DEPENDENCY_TITLE_PATTERNS:
+        if match := re.search(pattern, title, re.IGNORECASE):
+            return match.group(1).strip("`'\"")
+    return None
+
+
+def create_noise_record(noise_pulls: list) -> dict[str, Any]:
+    """Creates a grouped summary record for collapsed bot/noise PRs."""
+    packages = set()
+    dependency_bumps = 0
+
+    for pull in noise_pulls:
+        if package := extract_dependency_name(pull.title):
+            packages.add(package)
+            dependency_bumps += 1
+
+    other_count = len(noise_pulls) - dependency_bumps
+    parts = []
+    if dependency_bumps:
+        parts.append(
+            f"{dependency_bumps} dependency bumps across {len(packages)} packages"
+        )
+    if other_count:
+        parts.append(f"{other_count} other automated PRs")
+
+    return dict(
+        summary=", ".join(parts),
+        total_prs=len(noise_pulls),
+        dependency_bumps=dependency_bumps,
+        packages=sorted(packages),
+        authors=sorted({pull.user.login for pull in noise_pulls}),
+    )
+
+
+def collapse_noise_prs(
+    pulls, verbose: bool = get_config().verbose
+) -> tuple[list, dict[str, Any] | None]:
+    """Splits PR search results into regular PRs and a grouped bot/noise record.
+
+    Runs on search results only, so collapsed PRs never cost a detail fetch,
+    a comment fetch or prompt tokens for their individual records.
+    """
+    author_patterns, title_patterns, labels = load_noise_matchers()
+
+    kept, noise_pulls = [], []
+    for pull in pulls:
+        if is_noise_pr(pull, author_patterns, title_patterns, labels):
+            noise_pulls.append(pull)
+        else:
+            kept.append(pull)
+
+    if not noise_pulls:
+        return kept, None
+
+    noise_record = create_noise_record(noise_pulls)
+
+    if verbose:
+        # approximate the prompt tokens the individual records would have used
+        skipped_tokens = sum(
+            estimate_tokens(
+                json.dumps(
+                    dict(
+                        number=pull.number,
+                        title=pull.title,
+                        author=pull.user.login,
+                        url=pull.html_url,
+                        description=pull.body or "",
+                    )
+                )
+            )
+            for pull in noise_pulls
+        )
+        saved_tokens = max(
+            skipped_tokens - estimate_tokens(json.dumps(noise_record)), 0
+        )
+        console.print(
+            f"[bold blue]collapsed[/] {len(noise_pulls)} bot/noise PRs: {noise_record['summary']}"
+        )
+        console.print(
+            f"[bold blue]saved[/] {len(noise_pulls)} detail fetches, "
+            f"{len(noise_pulls)} comment fetches, ~{saved_tokens} prompt tokens"
+        )
+
+    return kept, noise_record
@@ -0,0 +1,166 @@
+import json
+import math
+import time
+from typing import Any
+
+from rich.console import Console
+from rich.table import Table
+
+from pr_pulse.config import get_config
+from pr_pulse.constants import (
+    BATCH_SIZE,
+    COMMENT_TOKENS_PER_PR,
+    MAX_OUTPUT_TOKENS,
+    PR_FETCH_REQUESTS,
+    REPORT_PROMPT,
+    SEARCH_PAGE_SIZE,
+)
+
+from .checkpoint import RunCheckpoint
+from .github import format_date_ymd, get_date_range, search_merged_pull_requests
+from .noise import collapse_noise_prs, is_noise_record, load_noise_matchers
+from .pool import GitHubClientPool
+from .tokens import estimate_tokens
+
+console = Console()
+
+
+def plan_run(
+    pool: GitHubClientPool,
+    repo: str,
+    days: int,
+    collapse_noise: bool = True,
+    checkpoint: RunCheckpoint | None = None,
+    verbose: bool = get_config().verbose,
+) -> dict[str, Any]:
+    """Estimates the API calls, wall time and prompt tokens of a run.
+
+    Only the search count query, one page of search results and `/rate_limit`
+    are requested; no PR details are fetched. PR records already stored in the
+    checkpoint are not counted as fetches (stored noise PRs are skipped when
+    `collapse_noise` is enabled, since they are not fetched either). REST calls
+    are checked against the budget the pool can lease before draining its
+    clients, and search calls against the search rate limit.
+    """
+    g = pool.best().github
+
+    started_at = time.monotonic()
+    rate_limit = g.get_rate_limit()
+    request_latency = time.monotonic() - started_at
+
+    pulls = search_merged_pull_requests(g, repo, days, verbose)
+    total_prs = pulls.totalCount
+    sample = pulls.get_page(0)
+
+    # extrapolate the noise ratio and record size from the first page
+    sample_kept = sample
+    if collapse_noise and sample:
+        sample_kept, _ = collapse_noise_prs(sample, verbose=False)
+    kept_ratio = len(sample_kept) / len(sample) if sample else 1
+    fetch_prs = round(total_prs * kept_ratio)
+
+    if checkpoint:
+        start_date, _ = get_date_range(days)
+        matchers = load_noise_matchers()
+        stored_prs = sum(
+            1
+            for record in checkpoint.load_pr_records().values()
+            if record.get("merged_at", "") >= format_date_ymd(start_date)
+            and not (collapse_noise and is_noise_record(record, *matchers))
+        )
+        fetch_prs = max(fetch_prs - stored_prs, 0)
+
+    record_tokens = (
+        sum(
+            estimate_tokens(
+                json.dumps(
+                    dict(
+                        number=pull.number,
+                        title=pull.title,
+                        author=pull.user.login,
+                        url=pull.html_url,
+                        description=pull.body or "",
+                    )
+                )
+            )
+            for pull in sample_kept
+        )
+        / len(sample_kept)
+        if sample_kept
+        else 0
+    )
+    prompt_tokens = estimate_tokens(REPORT_PROMPT) + round(
+        total_prs * kept_ratio * (record_tokens + COMMENT_TOKENS_PER_PR)
+    )
+
+    search_calls = max(math.ceil(total_prs / SEARCH_PAGE_SIZE), 1)
+    rest_calls = fetch_prs * PR_FETCH_REQUESTS
+    wall_time = request_latency * (
+        search_calls + math.ceil(fetch_prs / BATCH_SIZE) * PR_FETCH_REQUESTS
+    )
+
+    rate_limit_remaining = pool.leasable_remaining
+    search_remaining = rate_limit.search.remaining
+    max_prompt_tokens = get_config().max_prompt_tokens
+
+    return dict(
+        repository=repo,
+        days=days,
+        total_prs=total_prs,
+        fetch_prs=fetch_prs,
+        search_calls=search_calls,
+        rest_calls=rest_calls,
+        graphql_calls=0,
+        rate_limit_remaining=rate_limit_remaining,
+        search_remaining=search_remaining,
+        request_latency=request_latency,
+        wall_time=wall_time,
+        prompt_tokens=prompt_tokens,
+        output_tokens=MAX_OUTPUT_TOKENS,
+        max_prompt_tokens=max_prompt_tokens,
+        fits_rate_limit=rest_calls <= rate_limit_remaining
+        and search_calls <= search_remaining,
+        fits_token_budget=prompt_tokens <= max_prompt_tokens,
+    )
+
+
+def display_plan_table(plan: dict[str, Any], include_generation: bool = True):
+    """Displays a run plan in table format."""
+    table = Table(title=f"run plan for {plan['repository']} (last {plan['days']} days)")
+    table.add_column("field", style="cyan", justify="right")
+    table.add_column("value", style="green")
+
+    table.add_row("merged PRs", str(plan["total_prs"]))
+    table.add_row("PRs to fetch", str(plan["fetch_prs"]))
+    table.add_row("search calls", str(plan["search_calls"]))
+    table.add_row("REST calls", str(plan["rest_calls"]))
+    table.add_row("GraphQL calls", str(plan["graphql_calls"]))
+    table.add_row(
+        "rate limit remaining",
+        f"{plan['rate_limit_remaining']} REST (net of reserve), "
+        f"{plan['search_remaining']} search",
+    )
+    table.add_row(
+        "expected wall time",
+        f"~{plan['wall_time']:.0f}s ({BATCH_SIZE} concurrent, "
+        f"{plan['request_latency'] * 1000:.0f}ms/request)",
+    )
+    if include_generation:
+        table.add_row(
+            "prompt tokens",
+            f"~{plan['prompt_tokens']} (budget {plan['max_prompt_tokens']})",
+        )
+        table.add_row("max output tokens", str(plan["output_tokens"]))
+
+    console.print(table)
+
+    if plan["rest_calls"] > plan["rate_limit_remaining"]:
+        console.print(
+            "[bold red]error:[/] run needs more REST calls than the remaining rate limit"
+        )
+    if plan["search_calls"] > plan["search_remaining"]:
+        console.print(
+            "[bold red]error:[/] run needs more search calls than the remaining search rate limit"
+        )
+    if include_generation and not plan["fits_token_budget"]:
+        console.print("[bold red]error:[/] prompt exceeds the token budget")
@@ -0,0 +1,99 @@
+import contextlib
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+from github import Github
+from github.Repository import Repository
+from rich.console import Console
+
+from pr_pulse.config import get_config
+from pr_pulse.constants import PR_FETCH_REQUESTS, RATE_LIMIT_RESERVE
+
+console = Console()
+
+
+@dataclass
+class PooledClient:
+    """A GitHub client with its tracked core rate-limit budget."""
+
+    name: str
+    github: Github
+    repository: Repository
+    remaining: int
+    limit: int
+    reset_at: float
+    in_flight: int = 0
+
+    @property
+    def budget(self) -> int:
+        """Remaining requests, net of requests reserved by in-flight leases."""
+        remaining = self.limit if time.time() >= self.reset_at else self.remaining
+        return remaining - self.in_flight * PR_FETCH_REQUESTS
+
+
+class GitHubClientPool:
+    """Load-balances requests across GitHub credentials by remaining rate-limit budget.
+
+    Each lease goes to the client with the most remaining budget. Clients whose
+    budget falls below `reserve` are drained (no new leases) until their limit
+    resets; if every client is drained, leasing waits for the earliest reset.
+    """
+
+    def __init__(
+        self,
+        clients: list[PooledClient],
+        reserve: int = RATE_LIMIT_RESERVE,
+        verbose: bool = get_config().verbose,
+    ):
+        self.clients = clients
+        self.reserve = reserve
+        self.verbose = verbose
+        self._lock = threading.Lock()
+
+    @property
+    def leasable_remaining(self) -> int:
+        """Requests that can be leased before every client is drained."""
+        return sum(max(client.budget - self.reserve, 0) for client in self.clients)
+
+    def best(self) -> PooledClient:
+        """Returns the client with the most remaining budget."""
+        return max(self.clients, key=lambda client: client.budget)
+
+    def _acquire(self) -> PooledClient:
+        while True:
+            with self._lock:
+                client = self.best()
+                if client.budget > self.reserve:
+                    client.in_flight += 1
+                    return client
+                wait = min(c.reset_at for c in self.clients) - time.time()
+
+            console.print(
+                f"[bold yellow]warning:[/] all GitHub credentials are near their rate limit, "
+                f"waiting {max(wait, 0):.0f}s for the next reset"
+            )
+            time.sleep(max(wait, 1))
+
+    def _release(self, client: PooledClient) -> None:
+        # the last response on this client carries its current rate-limit headers,
+        # which belong to the search resource if a search ran on the same client
+        # in between; only headers matching the tracked core limit are applied
+        remaining, limit = client.github.rate_limiting
+        with self._lock:
+            client.in_flight -= 1
+            if limit == client.limit:
+                client.remaining = remaining
+                client.reset_at = client.github.rate_limiting_resettime
+            if self.verbose and client.budget <= self.reserve:
+                console.print(f"[bold blue]draining[/] {client.name} until reset")
+
+    @contextlib.contextmanager
+    def lease(self) -> Iterator[Repository]:
+        """Leases the repository instance of the client with the most remaining budget."""
+        client = self._acquire()
+        try:
+            yield client.repository
+        finally:
+            self._release(client)
@@ -0,0 +1,217 @@
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
+
+from google import genai
+from google.genai import types
+from rich.console import Console
+
+from pr_pulse.config import get_config
+from pr_pulse.constants import LLM_HEDGE_AFTER, LLM_REQUEST_TIMEOUT, MAX_OUTPUT_TOKENS
+
+console = Console()
+
+
+class GenerationError(Exception):
+    """Raised when no LLM provider could produce a response."""
+
+
+class LLMProvider(ABC):
+    """Interface for text generation backends."""
+
+    name: str
+
+    @abstractmethod
+    def stream(self, prompt: str) -> Iterator[str]:
+        """Streams generated text chunks for a prompt."""
+
+
+class GeminiProvider(LLMProvider):
+    """Gemini text generation via the google-genai client."""
+
+    def __init__(self, client: genai.Client, model: str):
+        self.client = client
+        self.model = model
+        self.name = f"gemini/{model}"
+
+    def stream(self, prompt: str) -> Iterator[str]:
+        generate_content_config = types.GenerateContentConfig(
+            temperature=1,
+            top_p=0.95,
+            top_k=40,
+            max_output_tokens=MAX_OUTPUT_TOKENS,
+            response_mime_type="text/plain",
+        )
+        response_stream = self.client.models.generate_content_stream(
+            model=self.model,
+            contents=prompt,
+            config=generate_content_config,
+        )
+        for chunk in response_stream:
+            if chunk.text:
+                yield chunk.text
+
+
+class _Attempt:
+    """A single in-flight generation request running on a background thread."""
+
+    def __init__(
+        self, index: int, provider: LLMProvider, prompt: str, events: queue.Queue
+    ):
+        self.index = index
+        self.provider = provider
+        self.started_at = time.monotonic()
+        self.chunks: list[str] = []
+        self.cancelled = threading.Event()
+        self.finished = False
+        threading.Thread(target=self._run, args=(prompt, events), daemon=True).start()
+
+    def _run(self, prompt: str, events: queue.Queue) -> None:
+        try:
+            for chunk in self.provider.stream(prompt):
+                if self.cancelled.is_set():
+                    return
+                events.put((self.index, "chunk", chunk))
+            events.put((self.index, "done", None))
+        except Exception as e:
+            events.put((self.index, "error", e))
+
+    @property
+    def active(self) -> bool:
+        return not (self.finished or self.cancelled.is_set())
+
+    def cancel(self) -> None:
+        # the underlying request cannot be aborted, its output is discarded instead
+        self.cancelled.set()
+
+
+def generate_text(
+    providers: list[LLMProvider],
+    prompt: str,
+    timeout: float = LLM_REQUEST_TIMEOUT,
+    hedge_after: float = LLM_HEDGE_AFTER,
+    on_chunk: Callable[[str], None] | None = None,
+    verbose: bool = get_config().verbose,
+) -> str:
+    """Generates text with per-request timeouts, hedging and ordered fallback.
+
+    Providers are tried in order. If the first token of the only in-flight
+    request has not arrived within `hedge_after` seconds, a hedged request is
+    started on the next provider and the first one to finish wins. When
+    `on_chunk` is given, the first request to emit a token is streamed and the
+    others are cancelled. Failed or timed out requests fall back to the next
+    provider; requests cancelled in favour of a streamed one are put back at
+    the front of the fallback order. If the streamed request fails partway, a
+    restart marker is printed before the fallback is streamed, so the output
+    after the last marker always matches the returned text. A `hedge_after` of
+    0 disables hedging.
+    """
+    if not providers:
+        raise GenerationError("no LLM providers configured")
+
+    events: queue.Queue = queue.Queue()
+    pending = list(providers)
+    attempts: list[_Attempt] = []
+    errors: list[str] = []
+    hedged = False
+    leader: _Attempt | None = None
+
+    def launch_next() -> bool:
+        if not pending:
+            return False
+        provider = pending.pop(0)
+        if verbose:
+            console.print(f"[bold blue]requesting[/] {provider.name}...")
+        attempts.append(_Attempt(len(attempts), provider, prompt, events))
+        return True
+
+    def fail(attempt: _Attempt, reason: str) -> None:
+        attempt.cancel()
+        errors.append(f"{attempt.provider.name}: {reason}")
+        if verbose or attempt is leader:
+            console.print(
+                f"\n[bold yellow]warning:[/] {attempt.provider.name} failed: {reason}"
+            )
+        if not any(a.active for a in attempts) and not launch_next():
+            raise GenerationError("all LLM providers failed: " + "; ".join(errors))
+
+    launch_next()
+
+    while True:
+        now = time.monotonic()
+        active = [a for a in attempts if a.active]
+
+        # check timeouts and whether a hedged request is due
+        for attempt in active:
+            if now - attempt.started_at >= timeout:
+                fail(attempt, f"timed out after {timeout}s")
+        active = [a for a in attempts if a.active]
+
+        can_hedge = (
+            hedge_after > 0
+            and not hedged
+            and len(active) == 1
+            and not active[0].chunks
+            and pending
+        )
+        if can_hedge and now - active[0].started_at >= hedge_after:
+            if verbose:
+                console.print(
+                    f"[bold blue]hedging[/] no response from {active[0].provider.name} "
+                    f"after {hedge_after}s"
+                )
+            hedged = True
+            launch_next()
+            continue
+
+        deadlines = [a.started_at + timeout for a in active]
+        if can_hedge:
+            deadlines.append(active[0].started_at + hedge_after)
+        wait = max(min(deadlines) - now, 0) if deadlines else None
+
+        try:
+            index, kind, payload = events.get(timeout=wait)
+        except queue.Empty:
+            continue
+
+        attempt = attempts[index]
+        if not attempt.active:
+            continue
+
+        if kind == "chunk":
+            attempt.chunks.append(payload)
+            if on_chunk is not None:
+                if leader is None or not leader.active:
+                    if leader is not None:
+                        console.print(
+                            f"[bold yellow]restarting[/] output with {attempt.provider.name}, "
+                            "discarding the partial output above"
+                        )
+                    leader = attempt
+                    # cancelled requests did not fail, keep them as fallbacks
+                    cancelled = [
+                        other
+                        for other in attempts
+                        if other is not attempt and other.active
+                    ]
+                    for other in cancelled:
+                        other.cancel()
+                    pending[:0] = [other.provider for other in cancelled]
+                on_chunk(payload)
+        elif kind == "done":
+            attempt.finished = True
+            for other in attempts:
+                if other.active:
+                    other.cancel()
+            if verbose:
+                if on_chunk is not None:
+                    console.print()
+                elapsed = time.monotonic() - attempt.started_at
+                console.print(
+                    f"[bold blue]completed[/] with {attempt.provider.name} in {elapsed:.1f}s"
+                )
+            return "".join(attempt.chunks)
+        else:
+            fail(attempt, str(payload))
@@ -0,0 +1,181 @@
+import asyncio
+import contextlib
+import sys
+import threading
+from collections.abc import Iterator
+from typing import Any
+
+import typer
+from mcp.server.fastmcp import FastMCP
+
+from pr_pulse.constants import CLUSTER_SIMILARITY_THRESHOLD
+
+from . import clients, github
+from .chains import generate_pr_summary_from_data
+from .clusters import cluster_pr_data
+from .index import PRIndex
+from .pool import GitHubClientPool
+from .providers import LLMProvider
+
+_stdout_lock = threading.Lock()
+_stdout_users = 0
+_original_stdout = sys.stdout
+
+
+@contextlib.contextmanager
+def stdout_to_stderr() -> Iterator[None]:
+    """Redirects console output to stderr while any worker thread is running.
+
+    The stdio transport owns stdout, so progress and report output printed by
+    the core functions must not end up there.
+    """
+    global _stdout_users, _original_stdout
+    with _stdout_lock:
+        if _stdout_users == 0:
+            _original_stdout = sys.stdout
+            sys.stdout = sys.stderr
+        _stdout_users += 1
+    try:
+        yield
+    finally:
+        with _stdout_lock:
+            _stdout_users -= 1
+            if _stdout_users == 0:
+                sys.stdout = _original_stdout
+
+
+class PRDataService:
+    """Serves PR data from a warm index, reusing authenticated clients across calls."""
+
+    def __init__(self, index: PRIndex | None = None):
+        self.index = index or PRIndex()
+        # client pools carry lease and drain state, so they live for the whole
+        # server lifetime instead of expiring with the indexed data
+        self._pools: dict[str, GitHubClientPool] = {}
+        self._providers: list[LLMProvider] | None = None
+        self._lock = threading.Lock()
+
+    def pool(self, repo: str) -> GitHubClientPool:
+        with self._lock:
+            if repo not in self._pools:
+                try:
+                    self._pools[repo] = clients.setup_github_pool(repo)
+                except typer.Exit:
+                    raise ValueError(f"could not set up GitHub access for {repo}")
+            return self._pools[repo]
+
+    def providers(self) -> list[LLMProvider]:
+        with self._lock:
+            if self._providers is None:
+                try:
+                    self._providers = clients.setup_llm_providers()
+                except typer.Exit:
+                    raise ValueError("could not set up LLM providers")
+            return self._providers
+
+    def list_prs(self, repo: str, days: int) -> dict[str, Any]:
+        def load() -> dict[str, Any]:
+            result, _ = github.get_pr_list_data(
+                self.pool(repo).best().github, repo, days
+            )
+            return result
+
+        return self.index.get_or_load(("list", repo, days), load)
+
+    def pr_detail(self, repo: str, pr_number: int) -> dict[str, Any]:
+        def load() -> dict[str, Any]:
+            return github.fetch_pooled_pr_record(self.pool(repo), pr_number)
+
+        return self.index.get_or_load(("pr", repo, pr_number), load)
+
+    def pr_details(
+        self, repo: str, days: int, collapse_noise: bool = False
+    ) -> dict[str, Any]:
+        def load() -> dict[str, Any]:
+            pool = self.pool(repo)
+            search = self.index.get_or_load(
+                ("search", repo, days, collapse_noise),
+                lambda: github.search_pr_numbers(
+                    pool.best().github, repo, days, collapse_noise=collapse_noise
+                ),
+            )
+
+            records = {}
+            for number in search["pr_numbers"]:
+                found, record = self.index.get(("pr", repo, number))
+                if found:
+                    records[number] = record
+
+            missing = [n for n in search["pr_numbers"] if n not in records]
+            for record in github.iter_pr_records(pool, missing):
+                self.index.put(("pr", repo, record["number"]), record)
+                records[record["number"]] = record
+
+            return {
+                "stats": search["stats"],
+                "pull_requests": [records[n] for n in search["pr_numbers"]],
+                "noise": search["noise"],
+            }
+
+        return self.index.get_or_load(("details", repo, days, collapse_noise), load)
+
+    def summary(self, repo: str, days: int) -> str:
+        def load() -> str:
+            pr_data = cluster_pr_data(
+                self.pr_details(repo, days, collapse_noise=True),
+                CLUSTER_SIMILARITY_THRESHOLD,
+            )
+            return generate_pr_summary_from_data(pr_data, self.providers())
+
+        return self.index.get_or_load(("summary", repo, days), load)
+
+
+def create_mcp_server(service: PRDataService | None = None) -> FastMCP:
+    """Creates an MCP server exposing PR Pulse operations as tools."""
+    service = service or PRDataService()
+    mcp = FastMCP(
+        "pr-pulse",
+        instructions="Fetch merged GitHub pull request data and generate Pulse insights.",
+    )
+
+    async def run(fn, *args):
+        # core functions are blocking, run them off the event loop so concurrent
+        # tool calls can be served (and coalesced) in parallel
+        def call():
+            with stdout_to_stderr():
+                return fn(*args)
+
+        return await asyncio.to_thread(call)
+
+    @mcp.tool()
+    async def list_prs(repo: str, days: int = 7) -> dict[str, Any]:
+        """List merged pull requests of a repository ('owner/repo') over the past days."""
+        return await run(service.list_prs, repo, days)
+
+    @mcp.tool()
+    async def get_pr_detail(repo: str, pr_number: int) -> dict[str, Any]:
+        """Get a pull request's details including description and comments."""
+        return await run(service.pr_detail, repo, pr_number)
+
+    @mcp.tool()
+    async def get_pr_details(
+        repo: str, days: int = 7, collapse_noise: bool = False
+    ) -> dict[str, Any]:
+        """Get details of all merged pull requests over the past days.
+
+        With collapse_noise, bot/noise PRs (dependency bumps, releases) are
+        grouped into a single summary record instead of being listed.
+        """
+        return await run(service.pr_details, repo, days, collapse_noise)
+
+    @mcp.tool()
+    async def generate_summary(repo: str, days: int = 7) -> str:
+        """Generate a Pulse insights summary of merged pull requests over the past days."""
+        return await run(service.summary, repo, days)
+
+    @mcp.tool()
+    async def index_stats() -> dict[str, int]:
+        """Show the number of indexed entries and index hit/miss counts."""
+        return service.index.stats()
+
+    return mcp
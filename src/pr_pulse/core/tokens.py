@@ -0,0 +1,6 @@
+from pr_pulse.constants import CHARS_PER_TOKEN
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimates the number of LLM tokens in a text using a character heuristic."""
+    return len(text) // CHARS_PER_TOKEN
@@ -0,0 +1,103 @@
+import datetime
+import gzip
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from pr_pulse.core import cache
+
+
+@pytest.fixture
+def run_dir(tmp_path, monkeypatch):
+    run_dir = tmp_path / "store" / "runs"
+    monkeypatch.setattr(
+        cache, "get_config", lambda: SimpleNamespace(run_dir=str(run_dir))
+    )
+    return run_dir
+
+
+def days_ago(days: int) -> str:
+    return (datetime.datetime.now() - datetime.timedelta(days=days)).strftime(
+        "%Y-%m-%dT%H:%M:%S"
+    )
+
+
+def write_store(run_dir) -> None:
+    repo_path = run_dir / "owner__repo"
+    (repo_path / "prs").mkdir(parents=True)
+    (repo_path / "summaries").mkdir(parents=True)
+    for number, age in [(1, 2), (2, 400)]:
+        record = dict(number=number, created_at=days_ago(age), merged_at=days_ago(age))
+        (repo_path / "prs" / f"{number}.json").write_text(json.dumps(record))
+    (repo_path / "summaries" / f"{days_ago(1)[:10]}-7d.md").write_text("report")
+    (repo_path / "summaries" / f"{days_ago(400)[:10]}-7d.md").write_text("old")
+
+
+def rewrite_snapshot(path, update) -> None:
+    snapshot = json.loads(gzip.decompress(path.read_bytes()))
+    update(snapshot)
+    path.write_bytes(gzip.compress(json.dumps(snapshot).encode()))
+
+
+def test_export_import_round_trip_drops_expired_entries(run_dir, tmp_path):
+    write_store(run_dir)
+    snapshot_file = tmp_path / "cache.json.gz"
+
+    counts = cache.export_snapshot(snapshot_file, retention_days=30, verbose=False)
+    assert counts == dict(repos=1, prs=1, summaries=1)
+    # the local store is compacted to the same window
+    assert [p.name for p in (run_dir / "owner__repo" / "prs").iterdir()] == ["1.json"]
+
+    for path in sorted(run_dir.rglob("*"), reverse=True):
+        path.unlink() if path.is_file() else path.rmdir()
+
+    counts = cache.import_snapshot(snapshot_file, verbose=False)
+    assert counts == dict(repos=1, prs=1, summaries=1)
+    assert (run_dir / "owner__repo" / "prs" / "1.json").exists()
+
+
+def test_import_rejects_checksum_mismatch(run_dir, tmp_path):
+    write_store(run_dir)
+    snapshot_file = tmp_path / "cache.json.gz"
+    cache.export_snapshot(snapshot_file, retention_days=30, verbose=False)
+
+    def tamper(snapshot):
+        snapshot["payload"]["repos"]["owner__repo"]["prs"][0]["number"] = 9
+
+    rewrite_snapshot(snapshot_file, tamper)
+    with pytest.raises(ValueError, match="checksum mismatch"):
+        cache.import_snapshot(snapshot_file, verbose=False)
+
+
+def test_import_rejects_unsupported_version(run_dir, tmp_path):
+    snapshot_file = tmp_path / "cache.json.gz"
+    cache.export_snapshot(snapshot_file, retention_days=30, verbose=False)
+
+    rewrite_snapshot(snapshot_file, lambda snapshot: snapshot.update(version=99))
+    with pytest.raises(ValueError, match="unsupported snapshot version"):
+        cache.import_snapshot(snapshot_file, verbose=False)
+
+
+@pytest.mark.parametrize("repo_key", ["..", ".", "", "../escape", "a/b", "a\\b"])
+def test_import_rejects_keys_escaping_the_store(run_dir, tmp_path, repo_key):
+    payload = dict(
+        repos={
+            repo_key: dict(prs=[dict(number=1, created_at=days_ago(1))], summaries={})
+        }
+    )
+    snapshot = dict(
+        format=cache.CACHE_SNAPSHOT_FORMAT,
+        version=cache.CACHE_SNAPSHOT_VERSION,
+        created_at=days_ago(0),
+        retention_days=30,
+        sha256=cache.compute_checksum(payload),
+        payload=payload,
+    )
+    snapshot_file = tmp_path / "cache.json.gz"
+    snapshot_file.write_bytes(gzip.compress(json.dumps(snapshot).encode()))
+
+    with pytest.raises(ValueError, match="invalid name"):
+        cache.import_snapshot(snapshot_file, verbose=False)
+    assert not (run_dir.parent / "prs").exists()
+    assert not run_dir.exists()
@@ -0,0 +1,152 @@
+import pytest
+
+from pr_pulse.core.clusters import (
+    cluster_pr_data,
+    create_cluster_entry,
+    find_pr_clusters,
+    strip_pr_template,
+)
+
+PR_TEMPLATE = """## Description
+<!-- Describe your changes in detail -->
+Please include a summary of the change and which issue is fixed.
+
+## Type of change
+- [ ] Bug fix (non-breaking change which fixes an issue)
+- [ ] New feature (non-breaking change which adds functionality)
+- [x] Documentation update
+
+## Checklist
+- [x] My code follows the style guidelines of this project
+- [ ] I have performed a self-review of my own code
+- [ ] I have added tests that prove my fix is effective
+"""
+
+UNRELATED_TITLES = [
+    "Fix crash in parser",
+    "Add dark mode toggle",
+    "Speed up CI cache",
+    "Bump docs theme colors",
+    "Refactor config loader",
+    "Add retry to webhook sender",
+]
+
+
+def make_pr(number: int, title: str, description: str = "") -> dict:
+    return dict(
+        number=number,
+        title=title,
+        author=f"user{number}",
+        url=f"https://github.com/owner/repo/pull/{number}",
+        description=f"{description}\n{PR_TEMPLATE}",
+        comments=dict(total=1, items=[dict(author="reviewer", body=f"lgtm {number}")]),
+    )
+
+
+def unrelated_prs(start: int = 100) -> list[dict]:
+    return [make_pr(start + i, title) for i, title in enumerate(UNRELATED_TITLES)]
+
+
+def test_strip_pr_template_keeps_only_prose():
+    assert strip_pr_template(PR_TEMPLATE) == (
+        "Please include a summary of the change and which issue is fixed."
+    )
+
+
+def test_shared_template_does_not_cluster_unrelated_prs():
+    clusters = find_pr_clusters(unrelated_prs())
+    assert clusters == [[i] for i in range(len(UNRELATED_TITLES))]
+
+
+@pytest.mark.parametrize(
+    "first, second",
+    [
+        (
+            (
+                "Add OAuth login flow",
+                "Adds an OAuth login flow using the authorization code grant.",
+            ),
+            (
+                "OAuth login: handle refresh tokens",
+                "Refresh expired OAuth access tokens during login.",
+            ),
+        ),
+        (
+            (
+                "Add dark mode toggle",
+                "Adds a toggle in settings to switch to a dark theme.",
+            ),
+            (
+                "Dark mode: fix contrast of code blocks",
+                "Code blocks were unreadable in dark mode.",
+            ),
+        ),
+        (
+            (
+                "Migrate CI to GitHub Actions",
+                "Replaces Travis with GitHub Actions workflows.",
+            ),
+            (
+                "CI: cache uv downloads in Actions workflow",
+                "Speeds up the GitHub Actions workflow by caching uv.",
+            ),
+        ),
+    ],
+)
+def test_follow_up_prs_are_clustered(first, second):
+    others = [pr for pr in unrelated_prs() if pr["title"] != first[0]]
+    prs = [make_pr(1, *first), make_pr(2, *second), *others]
+
+    clusters = find_pr_clusters(prs)
+
+    assert [0, 1] in clusters
+    assert sum(len(cluster) for cluster in clusters) == len(prs)
+    assert all(len(cluster) == 1 for cluster in clusters if cluster != [0, 1])
+
+
+def test_similarity_does_not_chain_across_clusters():
+    # a~b and b~c share different words, a and c share none
+    prs = [
+        make_pr(1, "Parser cache eviction"),
+        make_pr(2, "Parser cache warmup webhook retry"),
+        make_pr(3, "Webhook retry backoff"),
+        *unrelated_prs(),
+    ]
+    clusters = find_pr_clusters(prs)
+    assert not any({0, 2} <= set(cluster) for cluster in clusters)
+
+
+def test_cluster_size_is_capped():
+    prs = [
+        make_pr(i, "OAuth login flow", "OAuth login flow.") for i in range(1, 8)
+    ] + unrelated_prs()
+    clusters = find_pr_clusters(prs, max_size=3)
+    assert max(len(cluster) for cluster in clusters) == 3
+    assert sorted(i for cluster in clusters for i in cluster) == list(range(len(prs)))
+
+
+def test_cluster_entry_keeps_member_content():
+    prs = [
+        make_pr(
+            1, "Add OAuth login flow", "Adds an OAuth login flow using the code grant."
+        ),
+        make_pr(
+            2, "OAuth login: handle refresh tokens", "Refresh expired OAuth tokens."
+        ),
+    ]
+    entry = create_cluster_entry(prs)
+
+    assert [pr["number"] for pr in entry["pull_requests"]] == [1, 2]
+    # template checklists are stripped from related descriptions
+    assert len(entry["related_descriptions"]) == 1
+    assert entry["related_descriptions"][0].startswith("Refresh expired OAuth tokens.")
+    assert "[ ]" not in entry["related_descriptions"][0]
+    assert [c["body"] for c in entry["comments"]] == ["lgtm 1", "lgtm 2"]
+
+
+def test_cluster_pr_data_keeps_unrelated_prs_intact():
+    pr_data = dict(stats=dict(total_prs=6), pull_requests=unrelated_prs(), noise=None)
+    assert (
+        cluster_pr_data(pr_data, verbose=False)["pull_requests"]
+        == (pr_data["pull_requests"])
+    )
@@ -0,0 +1,116 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from pr_pulse.core import planner
+from pr_pulse.core.checkpoint import RunCheckpoint
+from pr_pulse.core.github import format_date
+from pr_pulse.core.pool import GitHubClientPool, PooledClient
+
+
+def make_pull(
+    number: int, title: str, author: str = "dev", labels=()
+) -> SimpleNamespace:
+    return SimpleNamespace(
+        number=number,
+        title=title,
+        user=SimpleNamespace(login=author),
+        html_url=f"https://github.com/owner/repo/pull/{number}",
+        body="",
+        labels=[SimpleNamespace(name=label) for label in labels],
+    )
+
+
+class FakeSearch(list):
+    @property
+    def totalCount(self) -> int:
+        return len(self)
+
+    def get_page(self, page: int) -> list:
+        return list(self)
+
+
+class FakeGithub:
+    def __init__(self, search_remaining: int = 30):
+        self.search_remaining = search_remaining
+
+    def get_rate_limit(self):
+        return SimpleNamespace(search=SimpleNamespace(remaining=self.search_remaining))
+
+
+def make_pool(remaining: int, search_remaining: int = 30, reserve: int = 50):
+    client = PooledClient(
+        name="token",
+        github=FakeGithub(search_remaining),
+        repository=None,
+        remaining=remaining,
+        limit=5000,
+        reset_at=time.time() + 3600,
+    )
+    return GitHubClientPool([client], reserve=reserve, verbose=False)
+
+
+@pytest.fixture
+def pulls(monkeypatch):
+    results = FakeSearch(
+        [make_pull(i, f"Feature {i}") for i in range(1, 11)]
+        + [make_pull(11, "Bump numpy from 2.2.4 to 2.2.5", "dependabot[bot]")]
+        + [make_pull(12, "Tune CI", labels=["dependencies"])]
+    )
+    monkeypatch.setattr(
+        planner, "search_merged_pull_requests", lambda *args, **kwargs: results
+    )
+    return results
+
+
+def store_record(checkpoint: RunCheckpoint, pull) -> None:
+    checkpoint.save_pr_record(
+        dict(
+            number=pull.number,
+            title=pull.title,
+            author=pull.user.login,
+            labels=[label.name for label in pull.labels],
+            created_at=format_date(planner.get_date_range(1)[1]),
+            merged_at=format_date(planner.get_date_range(1)[1]),
+        )
+    )
+
+
+def test_rate_limit_excludes_pool_reserve(pulls):
+    # 10 kept PRs need 30 REST calls; 70 remaining minus the 50 reserve is not enough
+    plan = planner.plan_run(make_pool(remaining=70), "owner/repo", 7, verbose=False)
+
+    assert plan["fetch_prs"] == 10
+    assert plan["rate_limit_remaining"] == 20
+    assert not plan["fits_rate_limit"]
+
+
+def test_search_calls_checked_against_search_limit(pulls):
+    plan = planner.plan_run(
+        make_pool(remaining=5000, search_remaining=0), "owner/repo", 7, verbose=False
+    )
+    assert plan["search_calls"] == 1
+    assert not plan["fits_rate_limit"]
+
+
+def test_stored_noise_prs_do_not_reduce_fetches(pulls, tmp_path):
+    checkpoint = RunCheckpoint("owner/repo", 7, run_dir=str(tmp_path))
+    # stored by a `get details --keep-noise` run: two regular and two noise PRs
+    for pull in [pulls[0], pulls[1], pulls[10], pulls[11]]:
+        store_record(checkpoint, pull)
+
+    plan = planner.plan_run(
+        make_pool(remaining=5000), "owner/repo", 7, checkpoint=checkpoint, verbose=False
+    )
+    assert plan["fetch_prs"] == 8
+
+    plan = planner.plan_run(
+        make_pool(remaining=5000),
+        "owner/repo",
+        7,
+        collapse_noise=False,
+        checkpoint=checkpoint,
+        verbose=False,
+    )
+    assert plan["fetch_prs"] == 8
@@ -0,0 +1,108 @@
+import time
+from collections.abc import Iterator
+
+import pytest
+
+from pr_pulse.core.providers import GenerationError, LLMProvider, generate_text
+
+
+class FakeProvider(LLMProvider):
+    """Replays scripted chunks with delays and an optional failure point."""
+
+    def __init__(
+        self,
+        name: str,
+        chunks: list[str],
+        first_token_delay: float = 0.0,
+        chunk_delay: float = 0.0,
+        fail_after: int | None = None,
+    ):
+        self.name = name
+        self.chunks = chunks
+        self.first_token_delay = first_token_delay
+        self.chunk_delay = chunk_delay
+        self.fail_after = fail_after
+        self.calls = 0
+
+    def stream(self, prompt: str) -> Iterator[str]:
+        self.calls += 1
+        time.sleep(self.first_token_delay)
+        for i, chunk in enumerate(self.chunks):
+            if i == self.fail_after:
+                break
+            if i:
+                time.sleep(self.chunk_delay)
+            yield chunk
+        if self.fail_after is not None:
+            raise RuntimeError(f"scripted failure after {self.fail_after} chunks")
+
+
+def test_falls_back_to_next_provider():
+    providers = [
+        FakeProvider("a", ["a1"], fail_after=0),
+        FakeProvider("b", ["b1", "b2"]),
+    ]
+    assert generate_text(providers, "prompt", verbose=False) == "b1b2"
+
+
+def test_hedged_request_wins_over_slow_provider():
+    providers = [
+        FakeProvider("slow", ["s1"], first_token_delay=2.0),
+        FakeProvider("fast", ["f1", "f2"]),
+    ]
+    started_at = time.monotonic()
+
+    result = generate_text(providers, "prompt", hedge_after=0.1, verbose=False)
+
+    assert result == "f1f2"
+    assert time.monotonic() - started_at < 1.0
+
+
+def test_timed_out_provider_falls_back():
+    providers = [
+        FakeProvider("stuck", ["s1"], first_token_delay=2.0),
+        FakeProvider("b", ["b1"]),
+    ]
+    result = generate_text(
+        providers, "prompt", timeout=0.2, hedge_after=0, verbose=False
+    )
+    assert result == "b1"
+
+
+def test_streamed_fallback_matches_returned_text(capsys):
+    providers = [
+        FakeProvider("a", ["a1", "a2"], chunk_delay=0.1, fail_after=1),
+        FakeProvider("b", ["b1", "b2"]),
+    ]
+    streamed: list[str] = []
+
+    result = generate_text(providers, "prompt", on_chunk=streamed.append, verbose=False)
+
+    assert result == "b1b2"
+    assert streamed == ["a1", "b1", "b2"]
+    assert "restarting" in capsys.readouterr().out
+
+
+def test_cancelled_hedge_is_retried_when_streamed_leader_fails():
+    # 'b' is hedged after 0.1s, cancelled when 'a' streams first, and must be
+    # restarted once 'a' fails partway
+    a = FakeProvider("a", ["a1", "a2", "a3"], first_token_delay=0.3, fail_after=2)
+    b = FakeProvider("b", ["b1", "b2"], first_token_delay=0.5)
+    streamed: list[str] = []
+
+    result = generate_text(
+        [a, b], "prompt", hedge_after=0.1, on_chunk=streamed.append, verbose=False
+    )
+
+    assert result == "b1b2"
+    assert streamed == ["a1", "a2", "b1", "b2"]
+    assert b.calls == 2
+
+
+def test_all_providers_failing_raises():
+    providers = [
+        FakeProvider("a", [], fail_after=0),
+        FakeProvider("b", ["b1"], fail_after=0),
+    ]
+    with pytest.raises(GenerationError, match="all LLM providers failed"):
+        generate_text(providers, "prompt", verbose=False)